@@ -11,8 +11,13 @@ This script:
 6. Visualizes the MPI trend over time
 """
 
+import bisect
 import calendar
+import functools
+import importlib.util
+import itertools
 import json
+import re
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -44,6 +49,17 @@ _MONTH_ABBR_TO_NUM = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_ymd(date_str: str) -> datetime:
+    """Parse a 'YYYY-MM-DD' string, memoized since the same dates recur across passes."""
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+def _date_ordinals(date_strs) -> frozenset[int]:
+    """Convert 'YYYY-MM-DD' strings to a frozenset of proleptic ordinals."""
+    return frozenset(_parse_ymd(d).toordinal() for d in (date_strs or ()))
+
+
 def parse_submission_month(submission_str) -> Optional[tuple[int, int]]:
     """Parse NHTSA 'MMM-YYYY' submission-date strings into (year, month)."""
     if not isinstance(submission_str, str) or len(submission_str) < 8:
@@ -74,7 +90,7 @@ def submission_to_release_date(submission_str, releases: list[dict]) -> Optional
     last_day = calendar.monthrange(year, month)[1]
     end_of_month = datetime(year, month, last_day)
     for rel in releases:
-        rdate = datetime.strptime(rel["release_date"], "%Y-%m-%d")
+        rdate = _parse_ymd(rel["release_date"])
         if rdate >= end_of_month:
             return rel["release_date"]
     return None  # Future submission — no known release yet
@@ -92,18 +108,31 @@ except ImportError:
     HAS_NUMPY = False
 
 try:
-    from scipy import optimize
-    from scipy import stats
-    HAS_SCIPY = True
+    import pyarrow  # noqa: F401  (only needed for pandas' Arrow-backed dtypes)
+    HAS_PYARROW = True
 except ImportError:
-    HAS_SCIPY = False
+    HAS_PYARROW = False
+
+# SciPy is only reported in the dependency check and matplotlib is only needed
+# by plot_mpi_trend, so probe for them here without paying their import cost.
+HAS_SCIPY = importlib.util.find_spec("scipy") is not None
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+
+# NHTSA CSV column-name candidates (the SGO schema has varied across releases).
+MAKE_COLUMNS = ['Make', 'MAKE', 'Manufacturer', 'MANUFACTURER', 'Vehicle Make']
+CITY_COLUMNS = ['City', 'CITY']
+DATE_COLUMNS = ['Incident Date', 'Date', 'INCIDENT_DATE', 'Report Date', 'Crash Date']
+
+# Known incident-date layouts, tried in order. NHTSA currently redacts to 'MMM-YYYY'.
+DATE_FORMATS = ['%b-%Y', '%Y-%m-%d', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y %H:%M']
+
+# Every column the analysis reads; the rest of the ~120-column CSVs is skipped at load.
+NHTSA_COLUMNS = (
+    ['Report ID', 'Report Version', 'Report Submission Date']
+    + MAKE_COLUMNS + CITY_COLUMNS + DATE_COLUMNS
+    + ['Roadway Type', 'SV Precrash Speed (MPH)', 'SV Pre-Crash Movement']
+)
 
 
 class FleetInterpolator:
@@ -124,15 +153,33 @@ class FleetInterpolator:
         """
         self.snapshots = []
         self.label = label
+        snapshot_ords = []
         skipped_count = 0
         for s in snapshots:
             total = s.get(field)
             if total is not None:
-                dt = datetime.strptime(s["date"], "%Y-%m-%d")
-                self.snapshots.append((dt, total))
+                # load_fleet_data pre-computes "_ord"; parse only if it is missing
+                ordinal = s.get("_ord")
+                if ordinal is None:
+                    ordinal = _parse_ymd(s["date"]).toordinal()
+                snapshot_ords.append(ordinal)
+                self.snapshots.append((datetime.fromordinal(ordinal), total))
             else:
                 skipped_count += 1
-        self.snapshots.sort(key=lambda x: x[0])
+
+        # Parallel ordinal/count arrays for O(log n) bracket lookup, sorted by
+        # integer ordinal in C rather than by Python-level datetime comparisons
+        if HAS_NUMPY:
+            ords = np.array(snapshot_ords, dtype=np.int64)
+            counts = np.array([c for _, c in self.snapshots], dtype=np.int32)
+            order = np.argsort(ords, kind='stable')
+            self._ords = ords[order]
+            self._counts = counts[order]
+            self.snapshots = [self.snapshots[i] for i in order]
+        else:
+            self.snapshots.sort(key=lambda x: x[0])
+            # Sorted snapshot dates for O(log n) bisect lookup without numpy
+            self._date_keys = [dt for dt, _ in self.snapshots]
 
         print(f"  FleetInterpolator ({label}): {len(self.snapshots)} fleet data points "
               f"({skipped_count} snapshots without {field} skipped, interpolating between known dates)")
@@ -142,27 +189,70 @@ class FleetInterpolator:
         if not self.snapshots:
             return 25
 
-        before = None
-        after = None
-
-        for dt, count in self.snapshots:
-            if dt <= target_date:
-                before = (dt, count)
-            if dt >= target_date and after is None:
-                after = (dt, count)
-
-        if before is None:
+        if HAS_NUMPY:
+            target_ord = target_date.toordinal()
+            i = int(np.searchsorted(self._ords, target_ord, side='right')) - 1
+            if i < 0:
+                return int(self._counts[0])
+            if i == len(self._ords) - 1:
+                return int(self._counts[-1])
+
+            before_ord, after_ord = int(self._ords[i]), int(self._ords[i + 1])
+            before_count, after_count = int(self._counts[i]), int(self._counts[i + 1])
+            ratio = (target_ord - before_ord) / (after_ord - before_ord)
+            return int(before_count + (after_count - before_count) * ratio)
+
+        i = bisect.bisect_right(self._date_keys, target_date) - 1
+        if i < 0:
             return self.snapshots[0][1]
-        if after is None:
-            return before[1]
-        if before[0] == after[0]:
-            return before[1]
+        before_dt, before_count = self.snapshots[i]
+        if before_dt == target_date or i == len(self.snapshots) - 1:
+            return before_count
 
-        total_days = (after[0] - before[0]).days
-        elapsed_days = (target_date - before[0]).days
+        after_dt, after_count = self.snapshots[i + 1]
+        total_days = (after_dt - before_dt).days
+        elapsed_days = (target_date - before_dt).days
         ratio = elapsed_days / total_days if total_days > 0 else 0
 
-        return int(before[1] + (after[1] - before[1]) * ratio)
+        return int(before_count + (after_count - before_count) * ratio)
+
+    def get_fleet_sizes(self, date_ordinals: "np.ndarray") -> "np.ndarray":
+        """Get interpolated fleet sizes for an array of date ordinals.
+
+        Vectorized equivalent of get_fleet_size: clamps to the first/last
+        snapshot outside the known range and truncates interpolated values
+        to whole vehicles.
+        """
+        date_ordinals = np.asarray(date_ordinals, dtype=np.int64)
+        if not self.snapshots:
+            return np.full(date_ordinals.shape, 25, dtype=np.int64)
+
+        n = len(self._ords)
+        idx = np.searchsorted(self._ords, date_ordinals, side='right') - 1
+        before = np.clip(idx, 0, n - 1)
+        after = np.clip(idx + 1, 0, n - 1)
+
+        span = self._ords[after] - self._ords[before]
+        elapsed = date_ordinals - self._ords[before]
+        ratio = np.divide(elapsed, span, out=np.zeros(date_ordinals.shape, dtype=np.float64),
+                          where=span > 0)
+        sizes = self._counts[before] + (self._counts[after] - self._counts[before]) * ratio
+        return sizes.astype(np.int64)
+
+    def _daily_arrays(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        excluded_dates: set[str] | None = None
+    ) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Return (day ordinals, fleet sizes, excluded mask) for a period."""
+        ords = np.arange(start_date.toordinal(), end_date.toordinal() + 1, dtype=np.int64)
+        sizes = self.get_fleet_sizes(ords)
+        if excluded_dates:
+            excluded = np.isin(ords, list(_date_ordinals(excluded_dates)))
+        else:
+            excluded = np.zeros(ords.shape, dtype=bool)
+        return ords, sizes, excluded
 
     def calculate_miles_in_period(
         self,
@@ -170,37 +260,143 @@ class FleetInterpolator:
         end_date: datetime,
         daily_miles_per_vehicle: int,
         excluded_dates: set[str] | None = None
-    ) -> tuple[int, list[dict]]:
+    ) -> tuple[int, float, int]:
         """Calculate total miles driven in a period with day-by-day fleet tracking.
 
         Args:
             excluded_dates: Set of date strings (YYYY-MM-DD) to skip (e.g. service stoppages).
+
+        Returns:
+            A tuple of (total miles, average fleet size, number of excluded days).
         """
+        if HAS_NUMPY:
+            _, sizes, excluded = self._daily_arrays(start_date, end_date, excluded_dates)
+            # Vehicle-days in service as one dot product, no per-day miles temporary
+            vehicle_days = int(np.dot(sizes, ~excluded))
+            avg_fleet = float(sizes.mean()) if len(sizes) else 0
+            return vehicle_days * daily_miles_per_vehicle, avg_fleet, int(excluded.sum())
+
+        # Running totals over the day sweep; no per-day dicts are built
+        excluded_ords = _date_ordinals(excluded_dates)
         total_miles = 0
-        daily_breakdown = []
+        fleet_total = 0
+        days = 0
+        excluded_days = 0
+        for day_ord, fleet_size in self._iter_daily_sizes(start_date, end_date):
+            days += 1
+            fleet_total += fleet_size
+            if day_ord in excluded_ords:
+                excluded_days += 1
+            else:
+                total_miles += fleet_size * daily_miles_per_vehicle
+        avg_fleet = fleet_total / days if days else 0
+        return total_miles, avg_fleet, excluded_days
 
-        current_date = start_date
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            fleet_size = self.get_fleet_size(current_date)
+    def calculate_miles_in_periods(
+        self,
+        boundaries: list[datetime],
+        daily_miles_per_vehicle: int,
+        excluded_dates: set[str] | None = None
+    ) -> list[tuple[int, float, int]]:
+        """Calculate miles for each consecutive pair of boundary dates.
 
-            if excluded_dates and date_str in excluded_dates:
-                day_miles = 0
-            else:
-                day_miles = fleet_size * daily_miles_per_vehicle
+        Equivalent to calling calculate_miles_in_period(boundaries[i], boundaries[i + 1])
+        for every pair (both ends inclusive), but the daily series is built once
+        and each interval is answered from prefix sums.
 
-            total_miles += day_miles
+        Args:
+            boundaries: Dates in non-decreasing order.
+            excluded_dates: Set of date strings (YYYY-MM-DD) to skip (e.g. service stoppages).
+
+        Returns:
+            One (total miles, average fleet size, number of excluded days) tuple per interval.
+        """
+        if len(boundaries) < 2:
+            return []
+
+        if not HAS_NUMPY:
+            return [
+                self.calculate_miles_in_period(start, end, daily_miles_per_vehicle, excluded_dates)
+                for start, end in zip(boundaries, boundaries[1:])
+            ]
+
+        _, sizes, excluded = self._daily_arrays(boundaries[0], boundaries[-1], excluded_dates)
+        base_ord = boundaries[0].toordinal()
+        offsets = np.array([b.toordinal() - base_ord for b in boundaries], dtype=np.int64)
+        starts, stops = offsets[:-1], offsets[1:] + 1
+
+        cum_active = np.concatenate(([0], np.cumsum(np.where(excluded, 0, sizes))))
+        cum_sizes = np.concatenate(([0], np.cumsum(sizes)))
+        cum_excluded = np.concatenate(([0], np.cumsum(excluded)))
+
+        miles = (cum_active[stops] - cum_active[starts]) * daily_miles_per_vehicle
+        avg_fleet = (cum_sizes[stops] - cum_sizes[starts]) / (stops - starts)
+        excluded_days = cum_excluded[stops] - cum_excluded[starts]
+        return list(zip(miles.tolist(), avg_fleet.tolist(), excluded_days.tolist()))
+
+    def get_daily_breakdown(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        daily_miles_per_vehicle: int,
+        excluded_dates: set[str] | None = None
+    ) -> list[dict]:
+        """Return one dict per day (date, fleet_size, daily_miles, excluded) for debugging."""
+        if HAS_NUMPY:
+            _, sizes, excluded = self._daily_arrays(start_date, end_date, excluded_dates)
+            day_miles = np.where(excluded, 0, sizes * daily_miles_per_vehicle)
+            date_strs = pd.date_range(start_date.date(), end_date.date(), freq='D').strftime("%Y-%m-%d")
+            return [
+                {
+                    "date": date_str,
+                    "fleet_size": size,
+                    "daily_miles": miles,
+                    "excluded": excl,
+                }
+                for date_str, size, miles, excl in zip(
+                    date_strs, sizes.tolist(), day_miles.tolist(), excluded.tolist()
+                )
+            ]
+
+        excluded_ords = _date_ordinals(excluded_dates)
+        daily_breakdown = []
+        for day_ord, fleet_size in self._iter_daily_sizes(start_date, end_date):
+            is_excluded = day_ord in excluded_ords
+            day_miles = 0 if is_excluded else fleet_size * daily_miles_per_vehicle
 
             daily_breakdown.append({
-                "date": date_str,
+                "date": datetime.fromordinal(day_ord).strftime("%Y-%m-%d"),
                 "fleet_size": fleet_size,
                 "daily_miles": day_miles,
-                "excluded": date_str in excluded_dates if excluded_dates else False
+                "excluded": is_excluded
             })
 
-            current_date += timedelta(days=1)
+        return daily_breakdown
+
+    def _iter_daily_sizes(self, start_date: datetime, end_date: datetime):
+        """Yield (day ordinal, fleet size) for each day in the period (no-numpy path)."""
+        # Days only move forward, so sweep a cursor over the sorted snapshots
+        # (O(days + snapshots)) instead of rescanning them for every day.
+        snap_ords = [dt.toordinal() for dt, _ in self.snapshots]
+        last = len(snap_ords) - 1
+        seg = -1  # index of the last snapshot on or before the current day
+
+        for day_ord in range(start_date.toordinal(), end_date.toordinal() + 1):
+            while seg < last and snap_ords[seg + 1] <= day_ord:
+                seg += 1
+
+            if not self.snapshots:
+                fleet_size = 25
+            elif seg < 0:
+                fleet_size = self.snapshots[0][1]
+            elif seg == last:
+                fleet_size = self.snapshots[last][1]
+            else:
+                before_count, after_count = self.snapshots[seg][1], self.snapshots[seg + 1][1]
+                ratio = (day_ord - snap_ords[seg]) / (snap_ords[seg + 1] - snap_ords[seg])
+                fleet_size = int(before_count + (after_count - before_count) * ratio)
 
-        return total_miles, daily_breakdown
+            yield day_ord, fleet_size
 
 
 class MPITrendAnalyzer:
@@ -209,30 +405,40 @@ class MPITrendAnalyzer:
     def __init__(self, incident_data: list[dict]):
         """Initialize with incident MPI data."""
         self.data = incident_data
-        self.days_since_start = []
-        self.mpi_values = []
-        self.dates = []
 
+        # One vectorized parse instead of a strptime per incident
+        self.dates = pd.to_datetime(
+            [d['incident_date'] for d in incident_data], format='%Y-%m-%d', cache=True
+        )
         if incident_data:
-            start_date = datetime.strptime(incident_data[0]['incident_date'], '%Y-%m-%d')
-            for d in incident_data:
-                incident_date = datetime.strptime(d['incident_date'], '%Y-%m-%d')
-                days = (incident_date - start_date).days
-                self.days_since_start.append(days)
-                self.mpi_values.append(d['mpi_since_previous'])
-                self.dates.append(incident_date)
+            self.days_since_start = (self.dates - self.dates[0]).days.to_numpy()
+        else:
+            self.days_since_start = np.empty(0, dtype=np.int64)
+        self.mpi_values = np.fromiter(
+            (d['mpi_since_previous'] for d in incident_data),
+            dtype=np.float64, count=len(incident_data)
+        )
+        self._fit_cache = None
 
     def exponential_trend(self) -> dict:
         """Fit exponential trend: MPI = a * exp(b*t) via log-linear regression.
 
         Uses linear regression on ln(MPI) vs t, which is equivalent to fitting
         the exponential model but guarantees R² between 0 and 1.
+        The fit is computed once and reused by get_best_fit() and forecast().
         """
+        if self._fit_cache is None:
+            self._fit_cache = self._fit_exponential()
+        return self._fit_cache
+
+    def _fit_exponential(self) -> dict:
+        """Compute the log-linear exponential fit (uncached)."""
         if not HAS_NUMPY or len(self.mpi_values) < 3:
             return {"error": "Insufficient data or numpy not available"}
 
-        x = np.array(self.days_since_start)
-        y = np.array(self.mpi_values)
+        # Already ndarrays from __init__; no per-fit copies
+        x = self.days_since_start
+        y = self.mpi_values
 
         # Log-linear regression: ln(y) = A + b*x where A = ln(a)
         log_y = np.log(y)
@@ -257,9 +463,15 @@ class MPITrendAnalyzer:
         a = np.exp(A)
 
         # R² in log space (always between 0 and 1 for linear regression)
-        log_y_pred = A + b * x
-        ss_res = np.sum((log_y - log_y_pred) ** 2)
-        ss_tot = np.sum((log_y - mean_log_y) ** 2)
+        # (residuals and deviations are squared in place, one buffer each)
+        resid = b * x
+        resid += A
+        np.subtract(log_y, resid, out=resid)
+        resid *= resid
+        ss_res = np.sum(resid)
+        dev = log_y - mean_log_y
+        dev *= dev
+        ss_tot = np.sum(dev)
         r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
 
         # Doubling/halving time
@@ -302,10 +514,12 @@ class MPITrendAnalyzer:
         if not HAS_NUMPY:
             return {"error": "numpy required for forecasting"}
 
-        x_future = np.array(self.days_since_start[-1]) + np.arange(1, days_ahead + 1)
+        x_future = self.days_since_start[-1] + np.arange(1, days_ahead + 1)
 
         model = best["best_fit"]
-        y_future = model["a"] * np.exp(model["b"] * x_future)
+        y_future = model["b"] * x_future
+        np.exp(y_future, out=y_future)
+        y_future *= model["a"]
 
         return {
             "forecast_days": days_ahead,
@@ -315,8 +529,26 @@ class MPITrendAnalyzer:
         }
 
 
-def load_nhtsa_data(data_dir: Path) -> tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
-    """Load NHTSA ADS and ADAS CSV files."""
+def read_nhtsa_csv(path: Path) -> pd.DataFrame:
+    """Read an NHTSA SGO CSV, keeping only the columns listed in NHTSA_COLUMNS."""
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = [col for col in NHTSA_COLUMNS if col in header]
+    if HAS_PYARROW:
+        # Arrow-backed columns: compact UTF-8 strings and faster .str kernels
+        return pd.read_csv(path, usecols=usecols, low_memory=False, dtype_backend='pyarrow')
+    return pd.read_csv(path, usecols=usecols, low_memory=False)
+
+
+def load_nhtsa_data(
+    data_dir: Path,
+    include_adas: bool = True
+) -> tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+    """Load NHTSA ADS and ADAS CSV files.
+
+    Args:
+        include_adas: Whether to read the ADAS (Level 2) file. Callers scoped to
+            ADS-only analysis can skip it; adas_df is then returned as None.
+    """
     ads_file = data_dir / "SGO-2021-01_Incident_Reports_ADS.csv"
     adas_file = data_dir / "SGO-2021-01_Incident_Reports_ADAS.csv"
 
@@ -325,14 +557,16 @@ def load_nhtsa_data(data_dir: Path) -> tuple[Optional[pd.DataFrame], Optional[pd
 
     if ads_file.exists():
         print(f"Loading ADS data from {ads_file}")
-        ads_df = pd.read_csv(ads_file, low_memory=False)
+        ads_df = read_nhtsa_csv(ads_file)
         print(f"  Loaded {len(ads_df)} ADS incidents")
     else:
         print(f"  ADS file not found: {ads_file}")
 
-    if adas_file.exists():
+    if not include_adas:
+        print("  Skipping ADAS data (not used by this analysis)")
+    elif adas_file.exists():
         print(f"Loading ADAS data from {adas_file}")
-        adas_df = pd.read_csv(adas_file, low_memory=False)
+        adas_df = read_nhtsa_csv(adas_file)
         print(f"  Loaded {len(adas_df)} ADAS incidents")
     else:
         print(f"  ADAS file not found: {adas_file}")
@@ -345,9 +579,8 @@ def filter_tesla_incidents(df: pd.DataFrame, system_type: str, city: str | None
     if df is None or len(df) == 0:
         return pd.DataFrame()
 
-    make_columns = ['Make', 'MAKE', 'Manufacturer', 'MANUFACTURER', 'Vehicle Make']
     make_col = None
-    for col in make_columns:
+    for col in MAKE_COLUMNS:
         if col in df.columns:
             make_col = col
             break
@@ -356,20 +589,25 @@ def filter_tesla_incidents(df: pd.DataFrame, system_type: str, city: str | None
         print(f"  Warning: Could not find make column in {system_type} data")
         return pd.DataFrame()
 
-    tesla_df = df[df[make_col].str.contains('Tesla', case=False, na=False)].copy()
+    # Lowercase once and do a plain substring match rather than a
+    # case-insensitive regex scan per row.
+    mask = df[make_col].str.lower().str.contains('tesla', regex=False, na=False)
 
+    city_col = None
     if city:
-        city_columns = ['City', 'CITY']
-        city_col = None
-        for col in city_columns:
-            if col in tesla_df.columns:
+        for col in CITY_COLUMNS:
+            if col in df.columns:
                 city_col = col
                 break
         if city_col:
-            tesla_df = tesla_df[tesla_df[city_col].str.contains(city, case=False, na=False)]
-            print(f"  Found {len(tesla_df)} Tesla {system_type} incidents in {city}")
-        else:
-            print(f"  Warning: Could not find city column in {system_type} data, skipping city filter")
+            mask &= df[city_col].str.lower().str.contains(city.lower(), regex=False, na=False)
+
+    tesla_df = df[mask].copy()
+
+    if city and city_col:
+        print(f"  Found {len(tesla_df)} Tesla {system_type} incidents in {city}")
+    elif city:
+        print(f"  Warning: Could not find city column in {system_type} data, skipping city filter")
     else:
         print(f"  Found {len(tesla_df)} Tesla {system_type} incidents")
 
@@ -381,15 +619,45 @@ def filter_tesla_incidents(df: pd.DataFrame, system_type: str, city: str | None
     return tesla_df
 
 
+def detect_date_format(values: pd.Series, sample_size: int = 100) -> Optional[str]:
+    """Return the DATE_FORMATS entry that parses the most of a sample of values.
+
+    Ties go to the earlier format; None if no format parses any sampled value.
+    """
+    sample = values.dropna().head(sample_size).astype(str).str.strip()
+    if len(sample) == 0:
+        return None
+    best_fmt, best_count = None, 0
+    for fmt in DATE_FORMATS:
+        count = int(pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum())
+        if count > best_count:
+            best_fmt, best_count = fmt, count
+            if count == len(sample):
+                break
+    return best_fmt
+
+
 def parse_incident_dates(df: pd.DataFrame) -> pd.DataFrame:
-    """Parse incident dates from various column formats."""
+    """Parse incident dates from various column formats.
+
+    Uses a fixed format detected from the column when possible, so pandas
+    parses in C instead of falling back to dateutil per element. Any values
+    that do not match that format are re-parsed generically.
+    """
     if df is None or len(df) == 0:
         return df
 
-    date_columns = ['Incident Date', 'Date', 'INCIDENT_DATE', 'Report Date', 'Crash Date']
-    for col in date_columns:
+    for col in DATE_COLUMNS:
         if col in df.columns:
-            df['parsed_date'] = pd.to_datetime(df[col], errors='coerce')
+            fmt = detect_date_format(df[col])
+            if fmt:
+                parsed = pd.to_datetime(df[col], format=fmt, errors='coerce', cache=True)
+                unparsed = parsed.isna() & df[col].notna()
+                if unparsed.any():
+                    parsed[unparsed] = pd.to_datetime(df.loc[unparsed, col], errors='coerce', cache=True)
+                df['parsed_date'] = parsed
+            else:
+                df['parsed_date'] = pd.to_datetime(df[col], errors='coerce', cache=True)
             valid_dates = df['parsed_date'].notna().sum()
             print(f"  Parsed {valid_dates} dates from column '{col}'")
             return df
@@ -418,6 +686,10 @@ def load_fleet_data(data_dir: Path) -> list[dict]:
     snapshots = data.get("snapshots", [])
     print(f"  Loaded {len(snapshots)} fleet snapshots")
 
+    # Parse each date once; FleetInterpolator and the sort below reuse "_ord"
+    for snapshot in snapshots:
+        snapshot["_ord"] = _parse_ymd(snapshot["date"]).toordinal()
+
     # Overlay active fleet data from fleet_growth_active.json
     active_file = data_dir / "fleet_growth_active.json"
     if active_file.exists():
@@ -428,17 +700,15 @@ def load_fleet_data(data_dir: Path) -> list[dict]:
             active_points = active_data.get("data", [])
             if active_points:
                 # Build lookup by date
-                active_by_date = {}
-                for pt in active_points:
-                    date = pt.get("date")
-                    if date:
-                        active_by_date[date] = pt
+                active_by_date = {pt["date"]: pt for pt in active_points if pt.get("date")}
+                existing_dates = {s["date"] for s in snapshots}
+                to_merge = existing_dates & active_by_date.keys()
 
                 # Merge active counts into existing snapshots
                 merged_count = 0
                 for snapshot in snapshots:
                     date = snapshot.get("date")
-                    if date and date in active_by_date:
+                    if date in to_merge:
                         apt = active_by_date[date]
                         if apt.get("austin") is not None:
                             snapshot["austin_active_vehicles"] = apt["austin"]
@@ -447,12 +717,13 @@ def load_fleet_data(data_dir: Path) -> list[dict]:
                             snapshot["bayarea_active_vehicles"] = apt["bayarea"]
 
                 # Add active-only dates that don't have a snapshot yet
-                existing_dates = {s["date"] for s in snapshots}
                 new_count = 0
-                for date, apt in active_by_date.items():
-                    if date not in existing_dates and apt.get("austin") is not None:
+                for date in active_by_date.keys() - existing_dates:
+                    apt = active_by_date[date]
+                    if apt.get("austin") is not None:
                         snapshots.append({
                             "date": date,
+                            "_ord": _parse_ymd(date).toordinal(),
                             "austin_vehicles": None,
                             "bayarea_vehicles": None,
                             "total_robotaxi": None,
@@ -463,7 +734,7 @@ def load_fleet_data(data_dir: Path) -> list[dict]:
                         })
                         new_count += 1
 
-                snapshots.sort(key=lambda s: s["date"])
+                snapshots.sort(key=lambda s: s["_ord"])
                 print(f"  Active fleet data: merged {merged_count} snapshots, added {new_count} new")
         except (json.JSONDecodeError, IOError) as e:
             print(f"  Warning: Could not load active fleet data: {e}")
@@ -508,45 +779,64 @@ def calculate_mpi_between_incidents(
     fleet_interpolator: FleetInterpolator,
     daily_miles: int,
     service_start: datetime,
-    excluded_dates: set[str] | None = None
+    excluded_dates: set[str] | None = None,
+    presorted: bool = False
 ) -> list[dict]:
     """
     Calculate miles driven between EACH consecutive pair of incidents.
 
     Returns a list with MPI for each interval, not cumulative.
     Days in excluded_dates are skipped (0 miles accumulated).
+    Pass presorted=True if incidents_df has already had undated rows dropped
+    and been sorted by parsed_date (e.g. when reused across fleet variants).
     """
     results = []
 
     if incidents_df is None or len(incidents_df) == 0 or 'parsed_date' not in incidents_df.columns:
         return results
 
-    sorted_incidents = incidents_df.dropna(subset=['parsed_date']).sort_values('parsed_date')
+    if presorted:
+        sorted_incidents = incidents_df
+    else:
+        sorted_incidents = incidents_df.dropna(subset=['parsed_date']).sort_values('parsed_date')
 
     if len(sorted_incidents) == 0:
         return results
 
-    prev_date = service_start
-    incident_num = 0
-    cumulative_miles = 0
-    cumulative_incidents = 0
+    # Pull the few NHTSA fields we emit as plain lists rather than building
+    # a Series per row with iterrows().
+    nhtsa_fields = {
+        col: sorted_incidents[col].tolist()
+        for col in ('Roadway Type', 'SV Precrash Speed (MPH)', 'SV Pre-Crash Movement')
+        if col in sorted_incidents.columns
+    }
 
-    for idx, row in sorted_incidents.iterrows():
-        incident_num += 1
-        incident_date = row['parsed_date'].to_pydatetime()
+    # Incidents on/after service start, with their position in the sorted frame
+    parsed_dates = sorted_incidents['parsed_date']
+    in_service = (parsed_dates >= service_start).to_numpy()
+    positions = list(itertools.compress(range(len(in_service)), in_service))
+    incident_dates = [ts.to_pydatetime() for ts in parsed_dates[in_service]]
 
-        if incident_date < service_start:
-            continue
+    # Miles for every interval from a single pass over the full date range
+    intervals = fleet_interpolator.calculate_miles_in_periods(
+        [service_start] + incident_dates, daily_miles, excluded_dates
+    )
 
-        # Calculate miles between previous incident and this one
-        miles, daily_breakdown = fleet_interpolator.calculate_miles_in_period(
-            prev_date, incident_date, daily_miles, excluded_dates
-        )
+    # Day gaps between consecutive incidents (the first measured from service start)
+    ords = [service_start.toordinal()] + [d.toordinal() for d in incident_dates]
+    if HAS_NUMPY:
+        gaps = np.diff(np.array(ords, dtype=np.int64)).tolist()
+    else:
+        gaps = [b - a for a, b in zip(ords, ords[1:])]
+
+    cumulative_miles = 0
+    cumulative_incidents = 0
+
+    for i, incident_date, interval, days_between in zip(positions, incident_dates, intervals, gaps):
+        incident_num = i + 1
+        miles, avg_fleet, excluded_days_in_period = interval
 
-        days_between = (incident_date - prev_date).days
-        excluded_days_in_period = sum(1 for d in daily_breakdown if d.get('excluded', False))
         active_days = days_between - excluded_days_in_period
-        avg_fleet = sum(d['fleet_size'] for d in daily_breakdown) / len(daily_breakdown) if daily_breakdown else 0
 
         cumulative_miles += miles
         cumulative_incidents += 1
@@ -564,15 +854,17 @@ def calculate_mpi_between_incidents(
         }
 
         # Include NHTSA fields for downstream filtering
-        if 'Roadway Type' in row.index:
-            result["roadway_type"] = str(row['Roadway Type']) if pd.notna(row['Roadway Type']) else ""
-        if 'SV Precrash Speed (MPH)' in row.index:
+        if 'Roadway Type' in nhtsa_fields:
+            roadway_type = nhtsa_fields['Roadway Type'][i]
+            result["roadway_type"] = str(roadway_type) if pd.notna(roadway_type) else ""
+        if 'SV Precrash Speed (MPH)' in nhtsa_fields:
             try:
-                result["precrash_speed_mph"] = int(row['SV Precrash Speed (MPH)'])
+                result["precrash_speed_mph"] = int(nhtsa_fields['SV Precrash Speed (MPH)'][i])
             except (ValueError, TypeError):
                 result["precrash_speed_mph"] = None
-        if 'SV Pre-Crash Movement' in row.index:
-            result["precrash_movement"] = str(row['SV Pre-Crash Movement']) if pd.notna(row['SV Pre-Crash Movement']) else ""
+        if 'SV Pre-Crash Movement' in nhtsa_fields:
+            movement = nhtsa_fields['SV Pre-Crash Movement'][i]
+            result["precrash_movement"] = str(movement) if pd.notna(movement) else ""
 
         if excluded_days_in_period > 0:
             result["excluded_days"] = excluded_days_in_period
@@ -580,11 +872,30 @@ def calculate_mpi_between_incidents(
 
         results.append(result)
 
-        prev_date = incident_date
-
     return results
 
 
+def average_mpi(results: list[dict]) -> float:
+    """Mean of the per-interval MPI values in results (0 if empty)."""
+    if not results:
+        return 0
+    # Plain sum(): extracting the column is a Python-level pass either way, and
+    # np.fromiter + .sum() on top of it measured slower at every size tried.
+    return sum(r['mpi_since_previous'] for r in results) / len(results)
+
+
+def summarize_results(results: list[dict], excluded_dates: set[str]) -> dict:
+    """Build the JSON summary block for one fleet variant's interval results."""
+    last = results[-1] if results else {}
+    return {
+        "average_mpi": average_mpi(results),
+        "latest_mpi": last.get('mpi_since_previous', 0),
+        "cumulative_mpi": last.get('cumulative_mpi', 0),
+        "total_miles": last.get('cumulative_miles', 0),
+        "total_excluded_days": len(excluded_dates)
+    }
+
+
 def aggregate_incidents_by_release(
     incidents_df: pd.DataFrame,
     fleet_interpolator: FleetInterpolator,
@@ -645,23 +956,21 @@ def aggregate_incidents_by_release(
               f"and were excluded from release aggregation")
 
     # Build one window per NHTSA release (skipping releases before service start).
+    # Releases are in chronological order, so window miles come from one pass.
+    active_releases = [
+        rel for rel in releases if _parse_ymd(rel["release_date"]) >= service_start
+    ]
+    release_dts = [_parse_ymd(rel["release_date"]) for rel in active_releases]
+    window_totals = fleet_interpolator.calculate_miles_in_periods(
+        [service_start] + release_dts, daily_miles, excluded_dates
+    )
+
     windows: list[dict] = []
     prev_boundary = service_start
-    for rel in releases:
+    for rel, release_dt, totals in zip(active_releases, release_dts, window_totals):
         release_date_str = rel["release_date"]
-        release_dt = datetime.strptime(release_date_str, "%Y-%m-%d")
-        if release_dt < service_start:
-            continue
-
-        window_days = (release_dt - prev_boundary).days
-        miles, breakdown = fleet_interpolator.calculate_miles_in_period(
-            prev_boundary, release_dt, daily_miles, excluded_dates
-        )
-        avg_fleet = (
-            sum(d["fleet_size"] for d in breakdown) / len(breakdown)
-            if breakdown else 0
-        )
-        excluded_days = sum(1 for d in breakdown if d.get("excluded", False))
+        window_days = release_dt.toordinal() - prev_boundary.toordinal()
+        miles, avg_fleet, excluded_days = totals
 
         rows = by_release.get(release_date_str, [])
         incidents: list[dict] = []
@@ -704,8 +1013,9 @@ def aggregate_incidents_by_release(
     return windows
 
 
-def get_sample_incidents() -> pd.DataFrame:
-    """Return sample incident data based on known Tesla Robotaxi crashes."""
+@functools.lru_cache(maxsize=1)
+def _build_sample_incidents() -> pd.DataFrame:
+    """Build the sample incident frame once per process."""
     incidents = [
         {"date": "2025-07-05", "description": "Low-speed collision, Austin"},
         {"date": "2025-07-18", "description": "Minor fender-bender, Austin"},
@@ -720,10 +1030,19 @@ def get_sample_incidents() -> pd.DataFrame:
     ]
 
     df = pd.DataFrame(incidents)
-    df['parsed_date'] = pd.to_datetime(df['date'])
+    df['parsed_date'] = pd.to_datetime(df['date'], format='%Y-%m-%d')
     return df
 
 
+def get_sample_incidents() -> pd.DataFrame:
+    """Return sample incident data based on known Tesla Robotaxi crashes.
+
+    The frame is built once and cached; callers get a copy so the cached
+    frame cannot be mutated.
+    """
+    return _build_sample_incidents().copy()
+
+
 def print_mpi_analysis(results: list[dict], scenario_name: str, daily_miles: int):
     """Print detailed MPI between each consecutive incident."""
     print(f"\n  {scenario_name} ({daily_miles} mi/day/vehicle):")
@@ -737,7 +1056,7 @@ def print_mpi_analysis(results: list[dict], scenario_name: str, daily_miles: int
 
     if results:
         final = results[-1]
-        avg_mpi = sum(r['mpi_since_previous'] for r in results) / len(results)
+        avg_mpi = average_mpi(results)
         print(f"  {'─' * 75}")
         print(f"  AVERAGE MPI (per interval): {avg_mpi:,.0f}")
         print(f"  CUMULATIVE MPI: {final['cumulative_mpi']:,.0f}")
@@ -775,17 +1094,26 @@ def print_trend_analysis(analyzer: MPITrendAnalyzer):
         print(f"    Trend: {forecast['trend'].upper()}")
 
 
+# Resolution of the saved trend chart PNG
+CHART_DPI = 150
+
+
 def plot_mpi_trend(results: list[dict], analyzer: MPITrendAnalyzer, output_path: Path):
     """Generate MPI trend visualization."""
     if not HAS_MATPLOTLIB or not HAS_NUMPY:
         print("\n  [Matplotlib/NumPy not available - skipping chart generation]")
         return
 
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+
     fig, axes = plt.subplots(2, 1, figsize=(12, 10))
 
-    dates = [datetime.strptime(r['incident_date'], '%Y-%m-%d') for r in results]
-    mpi_values = [r['mpi_since_previous'] for r in results]
-    cumulative_mpi = [r['cumulative_mpi'] for r in results]
+    # One columnar view of results instead of a list comprehension per field
+    df = pd.DataFrame(results, columns=['incident_date', 'mpi_since_previous', 'cumulative_mpi'])
+    dates = pd.to_datetime(df['incident_date'], format='%Y-%m-%d', cache=True)
+    mpi_values = df['mpi_since_previous'].to_numpy()
+    cumulative_mpi = df['cumulative_mpi'].to_numpy()
 
     # Top chart: MPI per interval with trend line
     ax1 = axes[0]
@@ -796,11 +1124,13 @@ def plot_mpi_trend(results: list[dict], analyzer: MPITrendAnalyzer, output_path:
     if len(dates) >= 3:
         best = analyzer.get_best_fit()
         if "error" not in best:
-            x_days = np.array(analyzer.days_since_start)
+            x_days = analyzer.days_since_start
             x_smooth = np.linspace(x_days[0], x_days[-1], 100)
 
             model = best['best_fit']
-            y_smooth = model['a'] * np.exp(model['b'] * x_smooth)
+            y_smooth = model['b'] * x_smooth
+            np.exp(y_smooth, out=y_smooth)
+            y_smooth *= model['a']
 
             start_date = dates[0]
             trend_dates = [start_date + timedelta(days=int(d)) for d in x_smooth]
@@ -831,15 +1161,55 @@ def plot_mpi_trend(results: list[dict], analyzer: MPITrendAnalyzer, output_path:
     plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
 
     plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=CHART_DPI, bbox_inches='tight')
+    plt.close(fig)
 
     print(f"\n  Chart saved to: {output_path}")
 
 
+def save_results(output_file: Path, output: dict) -> bool:
+    """Write analysis results as JSON unless only analysis_date would change.
+
+    The stored analysis_date therefore records when the results last
+    changed, not when the analysis last ran.
+
+    Returns:
+        True if the file was written, False if its content was already current.
+    """
+    if output_file.exists():
+        try:
+            existing = output_file.read_text(encoding='utf-8')
+            previous = json.loads(existing)
+        except (json.JSONDecodeError, OSError):
+            previous = None
+        if isinstance(previous, dict) and "analysis_date" in previous:
+            # Re-serialize with the stored timestamp so the comparison is byte-for-byte
+            unchanged = dict(output, analysis_date=previous["analysis_date"])
+            if json.dumps(unchanged, indent=2) == existing:
+                return False
+
+    with open(output_file, 'w') as f:
+        json.dump(output, f, indent=2)
+    return True
+
+
+# (compiled pattern, replacement template) for each description meta tag in
+# docs/index.html; templates are filled with {mpi} and {dt} before substitution.
+_META_TAG_REPLACEMENTS = [
+    # Meta description
+    (re.compile(r'(<meta\s+name="description"\s+content=")([^"]*)(">)'),
+     r'\g<1>Live Tesla Robotaxi safety data: {mpi} miles per incident, {dt}-day doubling time, Austin fleet status. Independent tracking of Cybercab crash rates vs human drivers and Waymo.\3'),
+    # OG description
+    (re.compile(r'(<meta\s+property="og:description"\s+content=")([^"]*)(">)'),
+     r'\g<1>Independent safety tracking: Tesla Cybercab achieving {mpi} miles between incidents in Austin. Safety doubling every {dt} days. Compare to human drivers & Waymo.\3'),
+    # Twitter description
+    (re.compile(r'(<meta\s+name="twitter:description"\s+content=")([^"]*)(">)'),
+     r'\g<1>Live safety data: {mpi} MPI, {dt}-day doubling time. Track Tesla Cybercab incidents vs human drivers.\3'),
+]
+
+
 def update_html_meta_tags(docs_dir: Path, latest_mpi: int, doubling_time: int):
     """Update meta description, OG, and Twitter tags in index.html with latest computed values."""
-    import re
     index_path = docs_dir / "index.html"
     if not index_path.exists():
         print(f"  Warning: {index_path} not found, skipping meta tag update")
@@ -848,20 +1218,13 @@ def update_html_meta_tags(docs_dir: Path, latest_mpi: int, doubling_time: int):
     html = index_path.read_text(encoding='utf-8')
     mpi_formatted = f"{latest_mpi:,}"
 
-    replacements = [
-        # Meta description
-        (r'(<meta\s+name="description"\s+content=")([^"]*)(">)',
-         rf'\g<1>Live Tesla Robotaxi safety data: {mpi_formatted} miles per incident, {doubling_time}-day doubling time, Austin fleet status. Independent tracking of Cybercab crash rates vs human drivers and Waymo.\3'),
-        # OG description
-        (r'(<meta\s+property="og:description"\s+content=")([^"]*)(">)',
-         rf'\g<1>Independent safety tracking: Tesla Cybercab achieving {mpi_formatted} miles between incidents in Austin. Safety doubling every {doubling_time} days. Compare to human drivers & Waymo.\3'),
-        # Twitter description
-        (r'(<meta\s+name="twitter:description"\s+content=")([^"]*)(">)',
-         rf'\g<1>Live safety data: {mpi_formatted} MPI, {doubling_time}-day doubling time. Track Tesla Cybercab incidents vs human drivers.\3'),
-    ]
+    original = html
+    for pattern, template in _META_TAG_REPLACEMENTS:
+        html = pattern.sub(template.format(mpi=mpi_formatted, dt=doubling_time), html)
 
-    for pattern, replacement in replacements:
-        html = re.sub(pattern, replacement, html)
+    if html == original:
+        print(f"  Meta tags in {index_path} already current (MPI: {mpi_formatted}, doubling: {doubling_time} days)")
+        return
 
     index_path.write_text(html, encoding='utf-8')
     print(f"  Updated meta tags in {index_path} (MPI: {mpi_formatted}, doubling: {doubling_time} days)")
@@ -890,7 +1253,8 @@ def main():
     print("LOADING DATA")
     print("─" * 75)
 
-    ads_df, adas_df = load_nhtsa_data(data_dir)
+    # ADAS (Level 2) reports are out of scope, so only the ADS file is read
+    ads_df, _ = load_nhtsa_data(data_dir, include_adas=False)
     fleet_snapshots = load_fleet_data(data_dir)
     fleet_interpolator = FleetInterpolator(fleet_snapshots, field="austin_vehicles", label="total")
     fleet_interpolator_active = FleetInterpolator(fleet_snapshots, field="austin_active_vehicles", label="active")
@@ -922,17 +1286,27 @@ def main():
     print("MPI BETWEEN CONSECUTIVE INCIDENTS")
     print("=" * 75)
 
+    # Drop undated rows and sort once; the total and active fleet runs share the order
+    sorted_tesla = all_tesla
+    if 'parsed_date' in all_tesla.columns:
+        sorted_tesla = all_tesla.dropna(subset=['parsed_date']).sort_values('parsed_date')
+
     daily_miles = 115  # Moderate scenario (based on Tesla's 250K miles / 97 days / ~20 vehicles)
-    results = calculate_mpi_between_incidents(all_tesla, fleet_interpolator, daily_miles, service_start, excluded_dates)
+    results = calculate_mpi_between_incidents(
+        sorted_tesla, fleet_interpolator, daily_miles, service_start, excluded_dates, presorted=True
+    )
 
     print_mpi_analysis(results, "Moderate (Total Fleet)", daily_miles)
 
     # Active fleet MPI calculation
-    results_active = calculate_mpi_between_incidents(all_tesla, fleet_interpolator_active, daily_miles, service_start, excluded_dates)
+    results_active = calculate_mpi_between_incidents(
+        sorted_tesla, fleet_interpolator_active, daily_miles, service_start, excluded_dates, presorted=True
+    )
     if results_active:
         print_mpi_analysis(results_active, "Moderate (Active Fleet)", daily_miles)
 
     # Trend analysis
+    analyzer = None
     if results:
         analyzer = MPITrendAnalyzer(results)
         print_trend_analysis(analyzer)
@@ -965,7 +1339,7 @@ def main():
     print("  Tesla FSD (supervised):     ~3,400,000 miles per crash (Tesla claim)")
 
     if results:
-        avg_mpi = sum(r['mpi_since_previous'] for r in results) / len(results)
+        avg_mpi = average_mpi(results)
         latest_mpi = results[-1]['mpi_since_previous']
         human_mpi = 500000
 
@@ -974,10 +1348,8 @@ def main():
         print(f"  → {human_mpi / avg_mpi:.1f}x worse than human drivers (average)")
         print(f"  → {human_mpi / latest_mpi:.1f}x worse than human drivers (latest)")
 
-    # Fleet visualization
-    print("\n" + "=" * 75)
-    print("FLEET SIZE OVER TIME")
-    print("=" * 75)
+    # Fleet visualization and notes are assembled into one buffer and written once
+    report = ["\n" + "=" * 75, "FLEET SIZE OVER TIME", "=" * 75]
 
     sample_dates = [
         datetime(2025, 6, 25), datetime(2025, 7, 15), datetime(2025, 8, 15),
@@ -985,18 +1357,27 @@ def main():
         datetime(2025, 12, 15), datetime(2026, 1, 15),
     ]
 
-    print(f"\n  {'Date':<12} {'Fleet Size':>12} {'Visual'}")
-    print(f"  {'─' * 50}")
-    for dt in sample_dates:
-        size = fleet_interpolator.get_fleet_size(dt)
-        bar = '█' * (size // 2)
-        print(f"  {dt.strftime('%Y-%m-%d'):<12} {size:>12} {bar}")
+    report.append(f"\n  {'Date':<12} {'Fleet Size':>12} {'Visual'}")
+    report.append(f"  {'─' * 50}")
+    if HAS_NUMPY:
+        sample_sizes = fleet_interpolator.get_fleet_sizes(
+            [dt.toordinal() for dt in sample_dates]
+        ).tolist()
+    else:
+        sample_sizes = [fleet_interpolator.get_fleet_size(dt) for dt in sample_dates]
+    # Bars are only useful on a terminal; cap them so large fleets fit the line
+    show_bars = sys.stdout.isatty()
+    for dt, size in zip(sample_dates, sample_sizes):
+        row = f"  {dt.strftime('%Y-%m-%d'):<12} {size:>12}"
+        if show_bars:
+            row += " " + '█' * min(size // 2, 80)
+        report.append(row)
 
     # Notes
-    print("\n" + "=" * 75)
-    print("NOTES & METHODOLOGY")
-    print("=" * 75)
-    print(f"""
+    report.append("\n" + "=" * 75)
+    report.append("NOTES & METHODOLOGY")
+    report.append("=" * 75)
+    report.append(f"""
   {'[SAMPLE DATA]' if use_sample else '[NHTSA DATA]'}
 
   MPI Calculation:
@@ -1017,12 +1398,12 @@ def main():
   - Not all incidents are equal in severity
   - Small sample size limits trend reliability
     """)
+    sys.stdout.write("\n".join(report) + "\n")
 
     # Save results
     output_file = data_dir / "analysis_results.json"
     trend_data = {}
-    if results:
-        analyzer = MPITrendAnalyzer(results)
+    if results and analyzer:
         trend_data = analyzer.get_best_fit()
 
     trend_data_active = {}
@@ -1030,12 +1411,10 @@ def main():
         trend_data_active = analyzer_active.get_best_fit()
 
     # Build stoppage summary for output
-    stoppage_summary = []
-    for stoppage in stoppages_list:
-        stoppage_summary.append({
-            "dates": stoppage.get("dates", []),
-            "reason": stoppage.get("reason", "Unknown")
-        })
+    stoppage_summary = [
+        {"dates": stoppage.get("dates", []), "reason": stoppage.get("reason", "Unknown")}
+        for stoppage in stoppages_list
+    ]
 
     # Fleet source is total (all vehicles in the Austin fleet)
     fleet_source = "total"
@@ -1046,13 +1425,7 @@ def main():
         active_fleet_output = {
             "incidents": results_active,
             "trend_analysis": trend_data_active,
-            "summary": {
-                "average_mpi": sum(r['mpi_since_previous'] for r in results_active) / len(results_active),
-                "latest_mpi": results_active[-1]['mpi_since_previous'],
-                "cumulative_mpi": results_active[-1]['cumulative_mpi'],
-                "total_miles": results_active[-1]['cumulative_miles'],
-                "total_excluded_days": len(excluded_dates)
-            }
+            "summary": summarize_results(results_active, excluded_dates)
         }
 
     output = {
@@ -1066,13 +1439,7 @@ def main():
         "service_stoppages": stoppage_summary,
         "incidents": results,
         "trend_analysis": trend_data,
-        "summary": {
-            "average_mpi": sum(r['mpi_since_previous'] for r in results) / len(results) if results else 0,
-            "latest_mpi": results[-1]['mpi_since_previous'] if results else 0,
-            "cumulative_mpi": results[-1]['cumulative_mpi'] if results else 0,
-            "total_miles": results[-1]['cumulative_miles'] if results else 0,
-            "total_excluded_days": len(excluded_dates)
-        },
+        "summary": summarize_results(results, excluded_dates),
         "active_fleet": active_fleet_output,
         "by_release": {
             "releases": NHTSA_RELEASES,
@@ -1081,9 +1448,10 @@ def main():
         },
     }
 
-    with open(output_file, 'w') as f:
-        json.dump(output, f, indent=2)
-    print(f"  Results saved to: {output_file}")
+    if save_results(output_file, output):
+        print(f"  Results saved to: {output_file}")
+    else:
+        print(f"  Results unchanged, keeping: {output_file}")
 
     # Update meta tags in docs/index.html with latest computed values
     if results and trend_data:
@@ -9,16 +9,25 @@ This script downloads the official CSV files from NHTSA containing:
 Data is updated monthly by NHTSA.
 """
 
+import hashlib
+import http.client
+import json
 import os
+import random
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 # Try to use requests if available, fall back to urllib
 try:
     import requests
     USE_REQUESTS = True
 except ImportError:
+    import urllib.error
     import urllib.request
     USE_REQUESTS = False
 
@@ -43,6 +52,25 @@ DATA_FILES = {
     }
 }
 
+# Downloads run concurrently; all files are served from the same NHTSA host
+MAX_PARALLEL_DOWNLOADS = 4
+
+# Read/write block size when streaming a download to disk
+CHUNK_SIZE = 1 << 16
+
+# Sidecar (in the data directory) recording ETag/Last-Modified/SHA-256 per
+# downloaded file, so unchanged files are revalidated with a conditional GET
+# (and a full re-download of identical bytes does not rewrite the file).
+# It is machine-local state: gitignored, and carried between CI runs by the
+# workflow's actions/cache step rather than committed with the data.
+CACHE_FILENAME = ".download_cache.json"
+
+# Retry policy for transient failures (connection errors, timeouts, 429/5xx)
+MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 1.0  # seconds; backoff cap grows as base * 2**attempt
+RETRY_MAX_DELAY = 30.0
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
 # Archive data (pre-June 2025)
 ARCHIVE_FILES = {
     "ADS_ARCHIVE": {
@@ -60,36 +88,204 @@ ARCHIVE_FILES = {
 
 def download_file(url: str, filepath: Path, description: str) -> bool:
     """Download a file from URL to filepath."""
-    print(f"Downloading: {description}")
-    print(f"  URL: {url}")
-    print(f"  To: {filepath}")
+    ok, report, _ = _download(url, filepath, description)
+    print("\n".join(report))
+    return ok
+
+
+def _download(
+    url: str,
+    filepath: Path,
+    description: str,
+    validators: Optional[dict] = None,
+    session=None
+) -> tuple[bool, list[str], Optional[dict]]:
+    """Download a file, returning (success, report lines, validators) instead of printing.
 
-    # Create parent directories if needed
-    filepath.parent.mkdir(parents=True, exist_ok=True)
+    Lets several downloads run concurrently while each file's output is
+    still printed as one block. If validators (the ETag/Last-Modified/size
+    recorded for filepath by a previous run) still match the local file,
+    the request is conditional and a 304 leaves the file untouched. The
+    returned validators describe the file now on disk (None on failure).
+    Pass a requests.Session to reuse its keep-alive connections.
+    """
+    report = [
+        f"Downloading: {description}",
+        f"  URL: {url}",
+        f"  To: {filepath}",
+    ]
 
+    # Stream into a sibling .partial file and move it into place only once
+    # complete, so a failed download never leaves a truncated CSV behind.
+    partial_path = filepath.with_name(filepath.name + ".partial")
+
+    # Any failure outside the retry loop (mkdir, stat, rename) still only
+    # fails this file, so the other downloads and the cache save go ahead
     try:
-        if USE_REQUESTS:
-            response = requests.get(url, timeout=60, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; NHTSA-Data-Downloader/1.0)'
-            })
-            response.raise_for_status()
-            filepath.write_bytes(response.content)
-            size = len(response.content)
-        else:
-            req = urllib.request.Request(url, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; NHTSA-Data-Downloader/1.0)'
-            })
-            with urllib.request.urlopen(req, timeout=60) as response:
-                data = response.read()
-                filepath.write_bytes(data)
-                size = len(data)
-
-        print(f"  ✓ Downloaded {size:,} bytes")
-        return True
+        # Create parent directories if needed
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        # Only revalidate if the local copy is the one the validators describe
+        conditional = {}
+        if validators and filepath.exists() and filepath.stat().st_size == validators.get("size"):
+            if validators.get("etag"):
+                conditional["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                conditional["If-Modified-Since"] = validators["last_modified"]
+
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                fetched = _stream_to_file(url, partial_path, conditional, session)
+                break
+            except Exception as e:
+                delay = _retry_delay(e, attempt) if attempt < MAX_ATTEMPTS - 1 else None
+                if delay is None:
+                    partial_path.unlink(missing_ok=True)
+                    report.append(f"  ✗ Failed: {e}")
+                    return False, report, None
+                report.append(f"  … Attempt {attempt + 1} failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+        if fetched is None:
+            report.append(f"  ✓ Unchanged since last download ({filepath.stat().st_size:,} bytes)")
+            return True, report, validators
 
+        size, new_validators = fetched
+        new_validators["size"] = size
+        # NHTSA sometimes answers 200 with the same bytes; keep the existing file
+        if (validators and validators.get("sha256") == new_validators["sha256"]
+                and filepath.exists() and filepath.stat().st_size == size):
+            partial_path.unlink()
+            report.append(f"  ✓ Content unchanged, kept existing file ({size:,} bytes)")
+            return True, report, new_validators
+
+        os.replace(partial_path, filepath)
+        report.append(f"  ✓ Downloaded {size:,} bytes")
+        return True, report, new_validators
     except Exception as e:
-        print(f"  ✗ Failed: {e}")
-        return False
+        try:
+            partial_path.unlink(missing_ok=True)
+        except OSError:
+            pass  # e.g. the parent directory could not be created
+        report.append(f"  ✗ Failed: {e}")
+        return False, report, None
+
+
+def _stream_to_file(
+    url: str,
+    path: Path,
+    extra_headers: dict,
+    session=None
+) -> Optional[tuple[int, dict]]:
+    """Stream the body at url into path in CHUNK_SIZE blocks.
+
+    Returns (bytes written, {"etag", "last_modified"} from the response plus
+    the body's "sha256"), or None if the server answered 304 Not Modified
+    (path is not created).
+    """
+    headers = {'User-Agent': 'Mozilla/5.0 (compatible; NHTSA-Data-Downloader/1.0)', **extra_headers}
+    size = 0
+    digest = hashlib.sha256()
+    if USE_REQUESTS:
+        get = session.get if session is not None else requests.get
+        with get(url, timeout=60, stream=True, headers=headers) as response:
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+            with open(path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+            response_headers = response.headers
+    else:
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            response = urllib.request.urlopen(req, timeout=60)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            raise
+        with response, open(path, 'wb') as f:
+            while chunk := response.read(CHUNK_SIZE):
+                f.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        response_headers = response.headers
+
+    return size, {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+        "sha256": digest.hexdigest(),
+    }
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying after error, or None if it is not transient.
+
+    Connection problems, timeouts and 429/5xx responses are retried with
+    "full jitter" exponential backoff; a numeric Retry-After header wins
+    when the server sends one. Anything else (e.g. 404) fails immediately.
+    """
+    status = None
+    headers = {}
+    if USE_REQUESTS:
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status, headers = error.response.status_code, error.response.headers
+        elif not isinstance(error, (requests.ConnectionError, requests.Timeout,
+                                    requests.exceptions.ChunkedEncodingError)):
+            return None
+    else:
+        if isinstance(error, urllib.error.HTTPError):
+            status, headers = error.code, error.headers
+        elif not isinstance(error, (urllib.error.URLError, http.client.IncompleteRead,
+                                    TimeoutError, ConnectionError)):
+            return None
+
+    if status is not None:
+        if status not in RETRYABLE_STATUS:
+            return None
+        retry_after = (headers or {}).get("Retry-After")
+        if retry_after and retry_after.strip().isdigit():
+            return min(RETRY_MAX_DELAY, float(retry_after))
+
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
+
+# Per-thread requests.Session: Session is not documented as thread-safe
+# (its cookie jar and adapters are shared state), so each download worker
+# keeps its own and reuses that connection for the files it fetches
+_worker = threading.local()
+
+
+def _make_session():
+    """Create a requests.Session for one download worker thread."""
+    session = requests.Session()
+    # Retries are handled (with backoff) by _download, not by urllib3
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=1, pool_maxsize=1, max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def load_download_cache(cache_path: Path) -> dict:
+    """Load per-file ETag/Last-Modified/size/SHA-256 validators from a previous run."""
+    if not cache_path.exists():
+        return {}
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return {}
+
+
+def save_download_cache(cache_path: Path, cache: dict):
+    """Persist download validators for conditional requests on the next run."""
+    with open(cache_path, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+        f.write("\n")
 
 
 def main():
@@ -105,32 +301,61 @@ def main():
     print(f"Download time: {datetime.now().isoformat()}")
     print()
 
-    # Download current data files
-    print("=" * 60)
-    print("CURRENT DATA FILES")
-    print("=" * 60)
+    # All files come from the same host and are independent, so fetch them
+    # concurrently and print each file's report in the usual order.
+    sections = [
+        ("CURRENT DATA FILES", DATA_FILES),
+        ("ARCHIVE DATA FILES (2021 - June 2025)", ARCHIVE_FILES),
+    ]
+    cache_path = data_dir / CACHE_FILENAME
+    cache = load_download_cache(cache_path)
+    filenames = [info["filename"] for _, files in sections for info in files.values()]
+    jobs = [
+        (info["url"], data_dir / info["filename"], info["description"],
+         cache.get(info["filename"]))
+        for _, files in sections
+        for info in files.values()
+    ]
 
-    success_count = 0
-    total_count = 0
+    # A keep-alive session per worker thread instead of a TCP/TLS handshake
+    # per file; they are collected here so they can be closed at the end
+    sessions = []
 
-    for name, info in DATA_FILES.items():
-        total_count += 1
-        filepath = data_dir / info["filename"]
-        if download_file(info["url"], filepath, info["description"]):
-            success_count += 1
-        print()
+    def start_worker():
+        _worker.session = _make_session()
+        sessions.append(_worker.session)
 
-    # Download archive files
-    print("=" * 60)
-    print("ARCHIVE DATA FILES (2021 - June 2025)")
-    print("=" * 60)
+    def run_job(job):
+        return _download(*job, session=getattr(_worker, "session", None))
+
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS,
+                                initializer=start_worker if USE_REQUESTS else None) as executor:
+            futures = [executor.submit(run_job, job) for job in jobs]
+
+            success_count = 0
+            total_count = 0
+            results = iter(zip(filenames, futures))
+            for title, files in sections:
+                print("=" * 60)
+                print(title)
+                print("=" * 60)
+
+                for _ in files:
+                    filename, future = next(results)
+                    ok, report, validators = future.result()
+                    total_count += 1
+                    if ok:
+                        success_count += 1
+                    if validators:
+                        cache[filename] = validators
+                    print("\n".join(report))
+                    print()
+    finally:
+        for session in sessions:
+            session.close()
 
-    for name, info in ARCHIVE_FILES.items():
-        total_count += 1
-        filepath = data_dir / info["filename"]
-        if download_file(info["url"], filepath, info["description"]):
-            success_count += 1
-        print()
+    save_download_cache(cache_path, cache)
 
     # Summary
     print("=" * 60)
@@ -17,10 +17,14 @@ Usage:
     pip install playwright
     playwright install chromium
     python scrape_fleet_data.py
+
+Set SCRAPE_DEBUG=1 to also save progress screenshots to data/
+(error screenshots are always saved).
 """
 
 import asyncio
 import json
+import os
 import re
 import sys
 from datetime import datetime
@@ -41,10 +45,97 @@ DATA_DIR = SCRIPT_DIR.parent / "data"
 OUTPUT_FILE = DATA_DIR / "fleet_data_scraped.json"
 FLEET_DATA_FILE = DATA_DIR / "fleet_data.json"
 
+# Progress screenshots cost a render + PNG encode each; only take them on request
+DEBUG_SCREENSHOTS = bool(os.environ.get("SCRAPE_DEBUG"))
+
 # URLs
 ROBOTAXI_TRACKER_URL = "https://robotaxitracker.com"
 NHTSA_PAGE_URL = "https://robotaxitracker.com/nhtsa"
 
+# Requests the scraper never needs: we only read text and chart data.
+# Stylesheets stay enabled because chart sizing and tooltip visibility
+# checks depend on the computed layout.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_URL_KEYWORDS = ("google-analytics", "googletagmanager", "gtag",
+                        "doubleclick", "hotjar")
+
+# A captured response only counts as the Active fleet series if its URL says
+# so ("/active", "?view=active", "activeFleet"; not "inactive"/"interactive").
+# Timing alone is not enough: the page may refetch Total data after the click.
+ACTIVE_SERIES_URL_RE = re.compile(r'(?<![a-z])active', re.IGNORECASE)
+
+# Fleet numbers in the rendered page HTML, tried in order (first match per
+# key wins). Compiled once at import instead of on every page.
+# NOTE: The site uses abbreviated labels at some viewport widths:
+#   "AUST" instead of "AUSTIN", "BAY AF" instead of "BAY AREA"
+FLEET_NUMBER_PATTERNS = [
+    # Fleet Growth section patterns - full and abbreviated labels
+    # IMPORTANT: Patterns must NOT match "UNSUPERVISED AUSTIN" (a different metric)
+    (re.compile(r"TOTAL\s*FLEET\s*(\d+)", re.IGNORECASE), "total_vehicles"),
+    # Bay Area: match "BAY AREA", "BAY AF", or "BAYAF"
+    (re.compile(r"BAY\s*(?:AREA|AF)\s*(\d+)", re.IGNORECASE), "bayarea_vehicles"),
+    # Austin: match "AUSTIN" or "AUST" but NOT "UNSUPERVISED AUSTIN"
+    (re.compile(r"(?<!UNSUPERVISED\s)(?<!\w)AUST(?:IN)?\s*(\d+)", re.IGNORECASE), "austin_vehicles"),
+    # Alternative patterns (also handle abbreviations)
+    (re.compile(r"(?<!Unsupervised\s)(?<!\w)Aust(?:in)?[:\s]*(\d+)\s*(?:vehicles?|cars?)?", re.IGNORECASE), "austin_vehicles"),
+    (re.compile(r"Bay\s*(?:Area|AF)[:\s]*(\d+)\s*(?:vehicles?|cars?)?", re.IGNORECASE), "bayarea_vehicles"),
+    (re.compile(r"Total[:\s]*(\d+)\s*(?:vehicles?|cars?|robotaxis?)?", re.IGNORECASE), "total_vehicles"),
+    (re.compile(r"(\d+)\s*(?:vehicles?|cars?)\s*(?:in\s*)?(?<!Unsupervised\s)Austin", re.IGNORECASE), "austin_vehicles"),
+    (re.compile(r"(\d+)\s*(?:vehicles?|cars?)\s*(?:in\s*)?(?:Bay\s*(?:Area|AF)|SF|San\s*Francisco)", re.IGNORECASE), "bayarea_vehicles"),
+]
+
+# Same labels on the Active tab of the Fleet Growth chart
+# IMPORTANT: Austin pattern must NOT match "UNSUPERVISED AUSTIN"
+ACTIVE_FLEET_NUMBER_PATTERNS = [
+    (re.compile(r"TOTAL\s*FLEET\s*(\d+)", re.IGNORECASE), "total_active"),
+    (re.compile(r"(?<!UNSUPERVISED\s)(?<!\w)AUST(?:IN)?\s*(\d+)", re.IGNORECASE), "austin_active"),
+    (re.compile(r"BAY\s*(?:AREA|AF)\s*(\d+)", re.IGNORECASE), "bayarea_active"),
+]
+
+# Tooltip date formats, ordered by specificity.
+# Most specific patterns first to avoid false matches
+TOOLTIP_DATE_PATTERNS = [
+    # Asian formats (most specific due to unique characters)
+    (re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日'), 'cjk'),  # Chinese/Japanese: 2025年6月22日
+    (re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'), 'korean'),  # Korean: 2025년 6월 22일
+
+    # ISO format (very specific)
+    (re.compile(r'(\d{4})-(\d{2})-(\d{2})'), 'iso'),  # ISO: 2025-06-22
+
+    # Full month name formats (before short names to avoid partial matches)
+    (re.compile(r'([A-Za-zäöüéèàùâêîôûëïç]+)\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE), 'month_day_year'),  # June 22, 2025
+    (re.compile(r'(\d{1,2})\.?\s+([A-Za-zäöüéèàùâêîôûëïç]+),?\s+(\d{4})', re.IGNORECASE), 'day_month_year'),  # 22 June 2025 or 22. Juni 2025
+
+    # Numeric formats (least specific, check last)
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), 'mdy_slash'),  # US: 6/22/2025 (assume M/D/Y for en-US locale)
+    (re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})'), 'dmy_dot'),  # European: 22.06.2025
+]
+
+# Month names seen in tooltip dates (comprehensive mappings for multiple languages)
+MONTH_MAP = {
+    # English short
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+    # English full
+    "january": 1, "february": 2, "march": 3, "april": 4, "june": 6,
+    "july": 7, "august": 8, "september": 9, "october": 10, "november": 11, "december": 12,
+    # German
+    "januar": 1, "februar": 2, "märz": 3, "april": 4, "mai": 5, "juni": 6,
+    "juli": 7, "august": 8, "september": 9, "oktober": 10, "november": 11, "dezember": 12,
+    # French
+    "janvier": 1, "février": 2, "mars": 3, "avril": 4, "mai": 5, "juin": 6,
+    "juillet": 7, "août": 8, "septembre": 9, "octobre": 10, "novembre": 11, "décembre": 12,
+    # Spanish
+    "enero": 1, "febrero": 2, "marzo": 3, "abril": 4, "mayo": 5, "junio": 6,
+    "julio": 7, "agosto": 8, "septiembre": 9, "octubre": 10, "noviembre": 11, "diciembre": 12,
+}
+
+# Tooltip series values (Bay Area also appears abbreviated as "Bay AF",
+# Austin as "Aust"; "Unsupervised Austin" is a different chart line)
+TOOLTIP_BAY_RE = re.compile(r'Bay\s*(?:Area|AF)[:\s]*(\d+)', re.IGNORECASE)
+TOOLTIP_AUSTIN_RE = re.compile(r'(?<!Unsupervised\s)(?<!unsupervised\s)(?<!\w)Aust(?:in)?[:\s]*(\d+)', re.IGNORECASE)
+TOOLTIP_TOTAL_RE = re.compile(r'Total[:\s]*(\d+)', re.IGNORECASE)
+
 
 async def scroll_and_wait_for_charts(page):
     """Scroll through the page to trigger lazy-loaded charts."""
@@ -54,57 +145,52 @@ async def scroll_and_wait_for_charts(page):
     page_height = await page.evaluate("document.body.scrollHeight")
     viewport_height = 1080
 
-    # Scroll down in steps to trigger IntersectionObserver for lazy elements
+    # Scroll down in steps to trigger IntersectionObserver for lazy elements.
+    # Observer callbacks run on the next rendering frames, so wait for two
+    # frames per step rather than a fixed half second.
     current_position = 0
     while current_position < page_height:
         current_position += viewport_height // 2
-        await page.evaluate(f"window.scrollTo(0, {current_position})")
-        await asyncio.sleep(0.5)  # Wait for lazy content to load
+        await page.evaluate("""
+            async (y) => {
+                window.scrollTo(0, y);
+                await new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+            }
+        """, current_position)
 
     # Scroll back to top
     await page.evaluate("window.scrollTo(0, 0)")
-    await asyncio.sleep(0.5)
 
-    # Now scroll specifically to Fleet Growth section and wait
+    # Now scroll specifically to Fleet Growth section
     try:
         fleet_section = await page.query_selector("text=Fleet Growth")
         if fleet_section:
             await fleet_section.scroll_into_view_if_needed()
             print("  Found Fleet Growth section, waiting for chart...")
-            await asyncio.sleep(2)  # Wait for chart animation to complete
     except Exception as e:
         print(f"  Could not scroll to Fleet Growth: {e}")
 
-    # Wait for a Recharts chart to render
-    for attempt in range(6):
-        has_chart = await page.evaluate("""
+    # Wait (up to the old 6 x 2s budget) for a full-sized Recharts chart
+    # with SVG content, returning as soon as it has rendered
+    try:
+        chart_handle = await page.wait_for_function("""
             () => {
                 const charts = document.querySelectorAll('.recharts-wrapper');
                 for (const chart of charts) {
                     const rect = chart.getBoundingClientRect();
                     if (rect.height >= 50 && rect.width >= 100) {
                         const paths = chart.querySelectorAll('svg path, svg line, svg rect, svg circle');
-                        return {
-                            height: rect.height,
-                            width: rect.width,
-                            pathCount: paths.length,
-                            hasContent: paths.length > 0
-                        };
+                        if (paths.length === 0) return null;
+                        return {height: rect.height, width: rect.width, pathCount: paths.length};
                     }
                 }
                 return null;
             }
-        """)
-        if has_chart:
-            print(f"  Recharts chart detected ({has_chart['width']:.0f}x{has_chart['height']:.0f}), "
-                  f"SVG elements: {has_chart['pathCount']}")
-            if has_chart['hasContent']:
-                await asyncio.sleep(1)
-                break
-            else:
-                print(f"  Chart container found but empty (attempt {attempt + 1}/6), waiting...")
-        await asyncio.sleep(2)
-    else:
+        """, timeout=12000)
+        has_chart = await chart_handle.json_value()
+        print(f"  Recharts chart detected ({has_chart['width']:.0f}x{has_chart['height']:.0f}), "
+              f"SVG elements: {has_chart['pathCount']}")
+    except PlaywrightTimeout:
         print("  No Recharts chart found after waiting, proceeding anyway...")
 
 
@@ -125,41 +211,14 @@ async def extract_fleet_numbers(page) -> dict:
     # Scroll through page to trigger lazy-loaded charts
     await scroll_and_wait_for_charts(page)
 
-    # Get page content
-    content = await page.content()
-
-    # Try to find fleet numbers using various patterns
-    # Pattern 1: Look for specific text patterns (based on robotaxitracker.com layout)
-    # NOTE: The site uses abbreviated labels at some viewport widths:
-    #   "AUST" instead of "AUSTIN", "BAY AF" instead of "BAY AREA"
-    patterns = [
-        # Fleet Growth section patterns - full and abbreviated labels
-        # IMPORTANT: Patterns must NOT match "UNSUPERVISED AUSTIN" (a different metric)
-        (r"TOTAL\s*FLEET\s*(\d+)", "total_vehicles"),
-        # Bay Area: match "BAY AREA", "BAY AF", or "BAYAF"
-        (r"BAY\s*(?:AREA|AF)\s*(\d+)", "bayarea_vehicles"),
-        # Austin: match "AUSTIN" or "AUST" but NOT "UNSUPERVISED AUSTIN"
-        (r"(?<!UNSUPERVISED\s)(?<!\w)AUST(?:IN)?\s*(\d+)", "austin_vehicles"),
-        # Alternative patterns (also handle abbreviations)
-        (r"(?<!Unsupervised\s)(?<!\w)Aust(?:in)?[:\s]*(\d+)\s*(?:vehicles?|cars?)?", "austin_vehicles"),
-        (r"Bay\s*(?:Area|AF)[:\s]*(\d+)\s*(?:vehicles?|cars?)?", "bayarea_vehicles"),
-        (r"Total[:\s]*(\d+)\s*(?:vehicles?|cars?|robotaxis?)?", "total_vehicles"),
-        (r"(\d+)\s*(?:vehicles?|cars?)\s*(?:in\s*)?(?<!Unsupervised\s)Austin", "austin_vehicles"),
-        (r"(\d+)\s*(?:vehicles?|cars?)\s*(?:in\s*)?(?:Bay\s*(?:Area|AF)|SF|San\s*Francisco)", "bayarea_vehicles"),
-    ]
-
-    # Maximum plausible fleet size - reject obviously wrong values
-    MAX_FLEET_SIZE = 2000
+    # The fallbacks below each cost a browser round trip or a full DOM
+    # serialization; stop once the three headline numbers are known
+    def have_all_counts():
+        return all(fleet_data[key] is not None for key in
+                   ("austin_vehicles", "bayarea_vehicles", "total_vehicles"))
 
-    for pattern, key in patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
-        if match and fleet_data[key] is None:
-            value = int(match.group(1))
-            if value <= MAX_FLEET_SIZE:
-                fleet_data[key] = value
-
-    # Try to extract from specific elements using JavaScript evaluation
-    # This handles dynamic React/Vue components better
+    # Try the rendered text first using JavaScript evaluation: it handles
+    # dynamic React/Vue components better and only ships back a few numbers
     try:
         js_extraction = """
         () => {
@@ -199,6 +258,30 @@ async def extract_fleet_numbers(page) -> dict:
     except Exception as e:
         print(f"  JS extraction failed: {e}")
 
+    if have_all_counts():
+        return fleet_data
+
+    # Fall back to the full page HTML for whatever is still missing
+    content = await page.content()
+
+    # Maximum plausible fleet size - reject obviously wrong values
+    MAX_FLEET_SIZE = 2000
+
+    # Try to find fleet numbers using the precompiled FLEET_NUMBER_PATTERNS.
+    # Later patterns for a key are fallbacks, so once a key is filled there
+    # is no need to scan the whole page again for it.
+    for regex, key in FLEET_NUMBER_PATTERNS:
+        if fleet_data[key] is not None:
+            continue
+        match = regex.search(content)
+        if match:
+            value = int(match.group(1))
+            if value <= MAX_FLEET_SIZE:
+                fleet_data[key] = value
+
+    if have_all_counts():
+        return fleet_data
+
     # Try to extract from specific elements
     selectors_to_try = [
         # Common dashboard element patterns
@@ -213,12 +296,16 @@ async def extract_fleet_numbers(page) -> dict:
     ]
 
     for selector, key in selectors_to_try:
+        if have_all_counts():
+            break
+        if fleet_data[key] is not None:
+            continue
         try:
             element = await page.query_selector(selector)
             if element:
                 text = await element.text_content()
                 numbers = re.findall(r'\d+', text)
-                if numbers and fleet_data[key] is None:
+                if numbers:
                     fleet_data[key] = int(numbers[0])
         except Exception:
             pass
@@ -639,44 +726,64 @@ async def extract_data_via_mouse_hover(page) -> list:
     chart_mid_y = bbox['y'] + bbox['height'] * 0.4  # Slightly above middle (hit bar area)
 
     num_samples = 80  # More samples for better coverage
+    coarse_stride = 4  # First pass hovers every 4th position
     step = (chart_right - chart_left) / num_samples
     seen_dates = set()
     debug_tooltip_count = 0
+    tooltip_at = {}  # position index -> tooltip text (None if no tooltip)
+    fresh_at = {}  # position index -> True if that tooltip is known to be current
+    last_text = None
 
-    print(f"  Hovering across chart with {num_samples} positions using native mouse...")
+    print(f"  Hovering across chart with up to {num_samples} positions using native mouse...")
 
     # First move to chart area to activate it
     await page.mouse.move(chart_left, chart_mid_y)
     await asyncio.sleep(0.5)
 
-    for i in range(num_samples + 1):
+    async def hover_at(i, confirm=False):
+        nonlocal debug_tooltip_count, last_text
         x = chart_left + (i * step)
 
         # Use Playwright's native mouse.move - this generates real browser events
         # that Recharts' internal event handler on the SVG overlay will pick up
         await page.mouse.move(x, chart_mid_y)
-        await asyncio.sleep(0.15)  # Give tooltip time to render
 
-        # Check for tooltip content - use only Recharts-specific selector
-        tooltip_text = await page.evaluate("""
-            () => {
-                // Only look at Recharts tooltip wrapper (not generic tooltips)
-                const el = document.querySelector('.recharts-tooltip-wrapper');
-                if (!el) return null;
-
-                const style = window.getComputedStyle(el);
-                // Recharts hides tooltip with visibility:hidden or opacity:0
-                if (style.visibility === 'hidden' || style.opacity === '0') {
-                    return null;
-                }
+        # Wait for the tooltip in-page instead of a fixed sleep: return as soon
+        # as it shows something new, give an unchanged tooltip a few polls in
+        # case the re-render lags, and give up after the old 150ms budget.
+        # Only a changed tooltip or the full budget counts as fresh; with
+        # confirm the early exit is skipped so the full budget is always used.
+        result = await page.evaluate("""
+            async ({previous, confirm}) => {
+                const readTooltip = () => {
+                    // Only look at Recharts tooltip wrapper (not generic tooltips)
+                    const el = document.querySelector('.recharts-tooltip-wrapper');
+                    if (!el) return null;
+
+                    const style = window.getComputedStyle(el);
+                    // Recharts hides tooltip with visibility:hidden or opacity:0
+                    if (style.visibility === 'hidden' || style.opacity === '0') {
+                        return null;
+                    }
 
-                const text = el.textContent || '';
-                if (text.trim().length > 0) {
-                    return text.trim();
+                    const text = (el.textContent || '').trim();
+                    return text.length > 0 ? text : null;
+                };
+
+                const deadline = performance.now() + 150;
+                let unchangedPolls = 0;
+                while (true) {
+                    await new Promise(resolve => setTimeout(resolve, 16));
+                    const text = readTooltip();
+                    if (text && text !== previous) return {text, fresh: true};
+                    if (!confirm && text && ++unchangedPolls >= 3) return {text, fresh: false};
+                    if (performance.now() >= deadline) return {text, fresh: true};
                 }
-                return null;
             }
-        """)
+        """, {"previous": last_text, "confirm": confirm})
+        tooltip_text = result["text"]
+        tooltip_at[i] = last_text = tooltip_text
+        fresh_at[i] = result["fresh"]
 
         if tooltip_text:
             # Debug: log first few raw tooltip texts
@@ -694,6 +801,38 @@ async def extract_data_via_mouse_hover(page) -> list:
                           f"Bay Area: {data_point.get('bayarea')}, "
                           f"Total: {data_point.get('total')}")
 
+    async def refine(lo, hi):
+        # Recharts snaps the tooltip to the nearest data point along x, so if
+        # both ends of a span show the same tooltip nothing new lies between.
+        # A tooltip taken on the early exit may still be the previous point's,
+        # so re-hover such ends before trusting the match.
+        if hi - lo <= 1:
+            return
+        if tooltip_at[lo] is not None and tooltip_at[lo] == tooltip_at[hi]:
+            for end in (lo, hi):
+                if not fresh_at[end]:
+                    await hover_at(end, confirm=True)
+            if tooltip_at[lo] is not None and tooltip_at[lo] == tooltip_at[hi]:
+                return
+        mid = (lo + hi) // 2
+        await hover_at(mid)
+        await refine(lo, mid)
+        await refine(mid, hi)
+
+    # Coarse pass across the whole width, then bisect only the spans whose
+    # endpoints differ. Sparse charts need far fewer hovers; dense ones end
+    # up visiting every position, as before.
+    coarse = list(range(0, num_samples + 1, coarse_stride))
+    if coarse[-1] != num_samples:
+        coarse.append(num_samples)
+    for i in coarse:
+        await hover_at(i)
+    for lo, hi in zip(coarse, coarse[1:]):
+        await refine(lo, hi)
+
+    print(f"  Hovered {len(tooltip_at)} of {num_samples + 1} positions")
+    historical.sort(key=lambda x: x["date"])
+
     # Move mouse away to dismiss tooltip
     await page.mouse.move(0, 0)
 
@@ -765,6 +904,19 @@ async def extract_chart_data_from_scripts(page) -> list:
                 if (window.__NEXT_DATA__) {
                     console.log('[scraper] Found __NEXT_DATA__');
                     findFleetArrays(window.__NEXT_DATA__, 0, '__NEXT_DATA__');
+                } else {
+                    // Some builds only ship the props as a JSON script tag
+                    const nextScript = document.getElementById('__NEXT_DATA__');
+                    if (nextScript) {
+                        try {
+                            findFleetArrays(JSON.parse(nextScript.textContent), 0, '#__NEXT_DATA__');
+                        } catch(e) {}
+                    }
+                }
+                // Nuxt apps keep their hydrated state in __NUXT__
+                if (window.__NUXT__) {
+                    console.log('[scraper] Found __NUXT__');
+                    findFleetArrays(window.__NUXT__, 0, '__NUXT__');
                 }
 
                 // Method 2: React fiber traversal - target Fleet Growth chart specifically
@@ -1030,46 +1182,8 @@ def parse_tooltip_text(text: str) -> dict:
         print(f"    [DEBUG] Tooltip text: {repr(text[:200])}")
         parse_tooltip_text._debug_count += 1
 
-    # Comprehensive month name mappings for multiple languages
-    month_map = {
-        # English short
-        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
-        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-        # English full
-        "january": 1, "february": 2, "march": 3, "april": 4, "june": 6,
-        "july": 7, "august": 8, "september": 9, "october": 10, "november": 11, "december": 12,
-        # German
-        "januar": 1, "februar": 2, "märz": 3, "april": 4, "mai": 5, "juni": 6,
-        "juli": 7, "august": 8, "september": 9, "oktober": 10, "november": 11, "dezember": 12,
-        # French
-        "janvier": 1, "février": 2, "mars": 3, "avril": 4, "mai": 5, "juin": 6,
-        "juillet": 7, "août": 8, "septembre": 9, "octobre": 10, "novembre": 11, "décembre": 12,
-        # Spanish
-        "enero": 1, "febrero": 2, "marzo": 3, "abril": 4, "mayo": 5, "junio": 6,
-        "julio": 7, "agosto": 8, "septiembre": 9, "octubre": 10, "noviembre": 11, "diciembre": 12,
-    }
-
-    # Try to extract date - various formats ordered by specificity
-    # Most specific patterns first to avoid false matches
-    date_patterns = [
-        # Asian formats (most specific due to unique characters)
-        (r'(\d{4})年(\d{1,2})月(\d{1,2})日', 'cjk'),  # Chinese/Japanese: 2025年6月22日
-        (r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', 'korean'),  # Korean: 2025년 6월 22일
-
-        # ISO format (very specific)
-        (r'(\d{4})-(\d{2})-(\d{2})', 'iso'),  # ISO: 2025-06-22
-
-        # Full month name formats (before short names to avoid partial matches)
-        (r'([A-Za-zäöüéèàùâêîôûëïç]+)\s+(\d{1,2}),?\s+(\d{4})', 'month_day_year'),  # June 22, 2025
-        (r'(\d{1,2})\.?\s+([A-Za-zäöüéèàùâêîôûëïç]+),?\s+(\d{4})', 'day_month_year'),  # 22 June 2025 or 22. Juni 2025
-
-        # Numeric formats (least specific, check last)
-        (r'(\d{1,2})/(\d{1,2})/(\d{4})', 'mdy_slash'),  # US: 6/22/2025 (assume M/D/Y for en-US locale)
-        (r'(\d{1,2})\.(\d{1,2})\.(\d{4})', 'dmy_dot'),  # European: 22.06.2025
-    ]
-
-    for pattern, fmt_name in date_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for regex, fmt_name in TOOLTIP_DATE_PATTERNS:
+        match = regex.search(text)
         if match:
             groups = match.groups()
             try:
@@ -1081,13 +1195,13 @@ def parse_tooltip_text(text: str) -> dict:
                 elif fmt_name == 'month_day_year':
                     # Month name, Day, Year (e.g., "June 22, 2025")
                     month_name = groups[0].lower()
-                    month_num = month_map.get(month_name) or month_map.get(month_name[:3])
+                    month_num = MONTH_MAP.get(month_name) or MONTH_MAP.get(month_name[:3])
                     if month_num:
                         result["date"] = f"{groups[2]}-{month_num:02d}-{int(groups[1]):02d}"
                 elif fmt_name == 'day_month_year':
                     # Day, Month name, Year (e.g., "22 June 2025")
                     month_name = groups[1].lower()
-                    month_num = month_map.get(month_name) or month_map.get(month_name[:3])
+                    month_num = MONTH_MAP.get(month_name) or MONTH_MAP.get(month_name[:3])
                     if month_num:
                         result["date"] = f"{groups[2]}-{month_num:02d}-{int(groups[0]):02d}"
                 elif fmt_name == 'mdy_slash':
@@ -1114,22 +1228,21 @@ def parse_tooltip_text(text: str) -> dict:
     MAX_FLEET_SIZE = 2000
 
     # Extract Bay Area number (match "Bay Area" or abbreviated "Bay AF")
-    bay_match = re.search(r'Bay\s*(?:Area|AF)[:\s]*(\d+)', text, re.IGNORECASE)
+    bay_match = TOOLTIP_BAY_RE.search(text)
     if bay_match:
         val = int(bay_match.group(1))
         if val <= MAX_FLEET_SIZE:
             result["bayarea"] = val
 
     # Extract Austin number - must NOT match "Unsupervised Austin" (a different chart line)
-    # Also match abbreviated "Aust"
-    austin_match = re.search(r'(?<!Unsupervised\s)(?<!unsupervised\s)(?<!\w)Aust(?:in)?[:\s]*(\d+)', text, re.IGNORECASE)
+    austin_match = TOOLTIP_AUSTIN_RE.search(text)
     if austin_match:
         val = int(austin_match.group(1))
         if val <= MAX_FLEET_SIZE:
             result["austin"] = val
 
     # Extract total
-    total_match = re.search(r'Total[:\s]*(\d+)', text, re.IGNORECASE)
+    total_match = TOOLTIP_TOTAL_RE.search(text)
     if total_match:
         val = int(total_match.group(1))
         if val <= MAX_FLEET_SIZE:
@@ -1239,8 +1352,6 @@ async def extract_active_fleet_numbers(page) -> dict:
         "total_active": None,
     }
 
-    content = await page.content()
-
     # The Active view shows a "Total Fleet" or "总车队" number
     # Look for patterns in the visible text
     MAX_FLEET_SIZE = 2000
@@ -1281,16 +1392,16 @@ async def extract_active_fleet_numbers(page) -> dict:
     except Exception as e:
         print(f"  JS active fleet extraction failed: {e}")
 
-    # Also try regex on HTML content
-    # IMPORTANT: Austin pattern must NOT match "UNSUPERVISED AUSTIN"
-    patterns = [
-        (r"TOTAL\s*FLEET\s*(\d+)", "total_active"),
-        (r"(?<!UNSUPERVISED\s)(?<!\w)AUST(?:IN)?\s*(\d+)", "austin_active"),
-        (r"BAY\s*(?:AREA|AF)\s*(\d+)", "bayarea_active"),
-    ]
-    for pattern, key in patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
-        if match and active_data[key] is None:
+    # Also try regex on HTML content, serializing the DOM only if the
+    # innerText pass above left something unfilled
+    content = None
+    for regex, key in ACTIVE_FLEET_NUMBER_PATTERNS:
+        if active_data[key] is not None:
+            continue
+        if content is None:
+            content = await page.content()
+        match = regex.search(content)
+        if match:
             value = int(match.group(1))
             if value <= MAX_FLEET_SIZE:
                 active_data[key] = value
@@ -1306,12 +1417,31 @@ async def extract_active_historical_data(page, captured_api_responses=None) -> l
     """Extract historical active fleet data after clicking the Active tab.
 
     Uses the same multi-strategy approach as extract_historical_data():
-    1. React/Next.js state extraction (chart data should reflect Active tab)
-    2. Native mouse hover for tooltip extraction
-
-    Note: captured_api_responses from before the tab click are NOT used here,
-    since they contain Total fleet data, not Active fleet data.
+    1. API responses fetched after the tab click whose URL names the Active
+       series (see ACTIVE_SERIES_URL_RE)
+    2. React/Next.js state extraction (chart data should reflect Active tab)
+    3. Native mouse hover for tooltip extraction
+
+    Note: callers must pass only the responses captured after the tab click;
+    anything fetched before it holds Total fleet data, not Active fleet data.
+    Even after the click, only responses whose URL identifies the Active
+    series are used, since the page may also refetch Total data.
     """
+    active_responses = [
+        resp for resp in (captured_api_responses or [])
+        if ACTIVE_SERIES_URL_RE.search(resp.get("url", ""))
+    ]
+    if active_responses:
+        print(f"  Checking {len(active_responses)} Active-series API responses...")
+        historical = extract_fleet_data_from_api_responses(active_responses)
+        if historical:
+            historical = deduplicate_by_date(historical)
+            if validate_historical_data(historical, "Active-API"):
+                print(f"  -> Found {len(historical)} valid active data points from API responses")
+                historical.sort(key=lambda x: x.get("date", ""))
+                return historical
+            print(f"  -> Active API data rejected by validation")
+
     # After clicking Active tab, the React state should now hold active data.
     # Re-run extraction strategies on the updated page state.
     print("  Extracting active chart data from page state...")
@@ -1350,7 +1480,11 @@ async def extract_active_historical_data(page, captured_api_responses=None) -> l
 
 
 async def extract_nhtsa_incidents(page) -> list:
-    """Extract NHTSA incident data from the /nhtsa page."""
+    """Extract NHTSA incident data from the /nhtsa page.
+
+    Navigates `page` away from wherever it was, so callers give it a tab
+    of its own.
+    """
     incidents = []
 
     try:
@@ -1388,10 +1522,16 @@ async def extract_nhtsa_incidents(page) -> list:
     return incidents
 
 
-async def take_screenshot(page, name: str):
-    """Take a screenshot for debugging."""
+async def take_screenshot(page, name: str, full_page: bool = False,
+                          always: bool = False):
+    """Take a screenshot for debugging (viewport only unless full_page).
+
+    Skipped unless SCRAPE_DEBUG is set, except for `always` (error) shots.
+    """
+    if not (always or DEBUG_SCREENSHOTS):
+        return
     screenshot_path = DATA_DIR / f"screenshot_{name}.png"
-    await page.screenshot(path=str(screenshot_path), full_page=True)
+    await page.screenshot(path=str(screenshot_path), full_page=full_page)
     print(f"Screenshot saved: {screenshot_path}")
 
 
@@ -1431,6 +1571,15 @@ async def scrape_robotaxi_tracker():
         except Exception:
             pass  # Some responses can't be read (e.g., streaming)
 
+    async def block_unneeded(route):
+        """Abort images, fonts, media and analytics; let everything else load."""
+        request = route.request
+        if (request.resource_type in BLOCKED_RESOURCE_TYPES or
+                any(keyword in request.url for keyword in BLOCKED_URL_KEYWORDS)):
+            await route.abort()
+        else:
+            await route.continue_()
+
     async with async_playwright() as p:
         # Launch browser
         print("\nLaunching browser...")
@@ -1447,12 +1596,18 @@ async def scrape_robotaxi_tracker():
             locale='en-US',  # Force English US locale for consistent date formats
             timezone_id='America/Los_Angeles',  # US Pacific timezone
         )
+        await context.route("**/*", block_unneeded)
 
         page = await context.new_page()
 
         # Listen for network responses to capture API data
         page.on("response", capture_response)
 
+        # The NHTSA page is independent of the main page, so load and parse it
+        # in its own tab while the main page is being scraped
+        nhtsa_page = await context.new_page()
+        nhtsa_task = asyncio.create_task(extract_nhtsa_incidents(nhtsa_page))
+
         try:
             # Navigate to main page
             print(f"\nNavigating to {ROBOTAXI_TRACKER_URL}...")
@@ -1472,18 +1627,20 @@ async def scrape_robotaxi_tracker():
             print(f"  Bay Area vehicles: {fleet_data['bayarea_vehicles']}")
             print(f"  Total vehicles: {fleet_data['total_vehicles']}")
 
-            # Scroll to Fleet Growth section and take screenshot
-            try:
-                fleet_section = await page.query_selector("text=Fleet Growth")
-                if fleet_section:
-                    await fleet_section.scroll_into_view_if_needed()
-                    await asyncio.sleep(2)  # Wait for chart to render
-                    await take_screenshot(page, "fleet_growth_section")
-            except Exception as e:
-                print(f"  Could not screenshot Fleet Growth section: {e}")
+            # Scroll to Fleet Growth section and take screenshot (debug only,
+            # so the render wait is skipped too)
+            if DEBUG_SCREENSHOTS:
+                try:
+                    fleet_section = await page.query_selector("text=Fleet Growth")
+                    if fleet_section:
+                        await fleet_section.scroll_into_view_if_needed()
+                        await asyncio.sleep(2)  # Wait for chart to render
+                        await take_screenshot(page, "fleet_growth_section")
+                except Exception as e:
+                    print(f"  Could not screenshot Fleet Growth section: {e}")
 
             # Take full page screenshot after all content loaded
-            await take_screenshot(page, "main_page_full")
+            await take_screenshot(page, "main_page_full", full_page=True)
 
             # Click "Total" tab explicitly to trigger data fetch
             # The chart may not render data until the tab is clicked
@@ -1546,8 +1703,9 @@ async def scrape_robotaxi_tracker():
             }
             active_historical = []
 
-            # Navigate back to main page if needed (after NHTSA extraction later)
-            # Click the "Active" tab on Fleet Growth chart
+            # Click the "Active" tab on Fleet Growth chart, remembering which
+            # responses arrive afterwards (candidates for the Active series)
+            active_responses_start = len(captured_api_responses)
             active_tab_clicked = await click_fleet_tab(page, "Active")
             if active_tab_clicked:
                 await take_screenshot(page, "fleet_growth_active")
@@ -1561,7 +1719,8 @@ async def scrape_robotaxi_tracker():
 
                 # Extract active historical data from chart tooltips
                 print("\nExtracting active historical data...")
-                active_historical = await extract_active_historical_data(page, captured_api_responses)
+                active_historical = await extract_active_historical_data(
+                    page, captured_api_responses[active_responses_start:])
                 print(f"  Found {len(active_historical)} active historical data points")
 
                 # Switch back to Total tab for consistency
@@ -1569,13 +1728,13 @@ async def scrape_robotaxi_tracker():
             else:
                 print("  Active tab not found - skipping active fleet extraction")
 
-            # Extract NHTSA incidents
+            # Collect NHTSA incidents (loaded in parallel in their own tab)
             print("\nExtracting NHTSA incidents...")
-            incidents = await extract_nhtsa_incidents(page)
+            incidents = await nhtsa_task
             print(f"  Found {len(incidents)} incidents")
 
             # Take screenshot of NHTSA page
-            await take_screenshot(page, "nhtsa_page")
+            await take_screenshot(nhtsa_page, "nhtsa_page")
 
             # Compile results
             result = {
@@ -1602,15 +1761,17 @@ async def scrape_robotaxi_tracker():
         except PlaywrightTimeout as e:
             print(f"\nTimeout error: {e}")
             print("The site may be blocking automated access.")
-            await take_screenshot(page, "error_timeout")
+            await take_screenshot(page, "error_timeout", full_page=True, always=True)
             return None
 
         except Exception as e:
             print(f"\nError during scraping: {e}")
-            await take_screenshot(page, "error")
+            await take_screenshot(page, "error", full_page=True, always=True)
             raise
 
         finally:
+            if not nhtsa_task.done():
+                nhtsa_task.cancel()
             await browser.close()
             print("\nBrowser closed.")
 
@@ -89,6 +89,7 @@ def _extract_metrics(analysis, fleet_data):
         metrics['total_miles_raw'] = summary.get('total_miles')
         metrics['latest_incident_date'] = latest.get('incident_date')
         metrics['service_start'] = analysis.get('service_start')
+        # analysis_date only moves when the results change (see save_results)
         metrics['analysis_date'] = analysis.get('analysis_date', '')[:10]
 
         # Trend info
@@ -254,7 +255,7 @@ def build_email_html(analysis, fleet_data=None):
     <!-- Footer -->
     <div style="text-align:center; border-top:1px solid #27272a; padding-top:20px;">
       <p style="color:#52525b; font-size:11px; margin:0 0 8px;">
-        Data sourced from NHTSA SGO reports &amp; robotaxitracker.com. Updated {m.get('analysis_date', 'recently')}.
+        Data sourced from NHTSA SGO reports &amp; robotaxitracker.com. Data last changed {m.get('analysis_date', 'recently')}.
       </p>
       <p style="color:#71717a; font-size:12px; margin:0 0 8px;">
         You received this because you subscribed to Tesla Robotaxi Safety Tracker updates.